@@ -5,13 +5,16 @@
 from __future__ import annotations
 
 import logging
+import os
+import struct
 import yaml
 import sys
 import threading
 import time
-import wave
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
+from math import gcd
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -21,8 +24,16 @@ RECORDINGS_DIR = LOG_DIR / "recordings"
 # Load config (defaults if missing or invalid)
 def _load_config() -> dict:
     default = {
-        "whisper": {"model": "base", "language": None, "vad_filter": True, "compute_type": "int8"},
-        "recording": {"sample_rate": 16000, "input_device": None, "min_duration_sec": 1.2},
+        "whisper": {
+            "model": "base",
+            "language": None,
+            "vad_filter": True,
+            "compute_type": "auto",
+            "cpu_threads": 0,
+            "beam_size": 1,
+            "stream_chunk_sec": 10.0,
+        },
+        "recording": {"sample_rate": 16000, "input_device": None, "min_duration_sec": 1.2, "save_wav": False},
         "ui": {"hotkey_debounce_sec": 0.6, "overlay_offset_from_bottom_px": 72},
     }
     config_path = SCRIPT_DIR / "config.yml"
@@ -44,9 +55,46 @@ def _load_config() -> dict:
     except Exception:
         return default
 
+def _physical_cpu_count() -> int:
+    # GEMM threads scale with physical cores; hyperthreads mostly add contention
+    try:
+        import psutil
+        physical = psutil.cpu_count(logical=False)
+    except Exception:
+        physical = None
+    if physical:
+        return physical
+    return max(1, (os.cpu_count() or 2) // 2)  # assume 2-way SMT without psutil
+
+
+def _whisper_language(whisper_cfg: dict) -> str | None:
+    """Configured language; English-only models (*.en) are always "en", skipping language detection."""
+    if str(whisper_cfg["model"]).endswith(".en"):
+        return "en"
+    return whisper_cfg.get("language")
+
+
 CONFIG = _load_config()
 WHISPER_TARGET_RATE = 16000
 
+# Values read on every recording / hotkey press / transcription, resolved once
+RECORD_SAMPLE_RATE = int(CONFIG["recording"]["sample_rate"])
+MIN_DURATION_SEC = float(CONFIG["recording"]["min_duration_sec"])
+SAVE_WAV = bool(CONFIG["recording"]["save_wav"])
+HOTKEY_DEBOUNCE_SEC = float(CONFIG["ui"]["hotkey_debounce_sec"])
+WHISPER_LANGUAGE = _whisper_language(CONFIG["whisper"])
+VAD_FILTER = bool(CONFIG["whisper"]["vad_filter"])
+BEAM_SIZE = int(CONFIG["whisper"]["beam_size"] or 1)
+STREAM_CHUNK_SEC = float(CONFIG["whisper"]["stream_chunk_sec"] or 0)
+CPU_THREADS = int(CONFIG["whisper"]["cpu_threads"] or 0) or _physical_cpu_count()
+
+# OpenMP/BLAS runtimes size their thread pools when first loaded, so this must run
+# before numpy / faster-whisper are imported. Explicit environment settings win.
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, str(CPU_THREADS))
+if sys.platform == "win32":
+    os.environ.setdefault("OMP_PROC_BIND", "close")  # keep worker threads on neighbouring cores
+
 def _setup_logging() -> None:
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     RECORDINGS_DIR.mkdir(parents=True, exist_ok=True)
@@ -78,7 +126,9 @@ except ImportError:
     print("Missing: pip install sounddevice scipy numpy")
     sys.exit(1)
 try:
+    import ctranslate2
     from faster_whisper import WhisperModel
+    from huggingface_hub.utils import LocalEntryNotFoundError
 except ImportError:
     print("Missing: pip install faster-whisper (and FFmpeg in PATH)")
     sys.exit(1)
@@ -90,13 +140,13 @@ except ImportError:
     sys.exit(1)
 try:
     import pystray
-    from PIL import Image, ImageDraw
+    from PIL import Image
 except ImportError:
     print("Missing: pip install pystray Pillow")
     sys.exit(1)
 import tkinter as tk
 import ctypes
-from queue import Queue, Empty
+from queue import Queue
 
 
 class State(Enum):
@@ -105,17 +155,22 @@ class State(Enum):
     PROCESSING = "processing"
 
 
-# --- Tray icons (Pillow: colored circles) ---
-def make_icon_image(color: tuple[int, int, int], size: int = 64) -> Image.Image:
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
-    margin = 4
-    d.ellipse([margin, margin, size - margin, size - margin], fill=color, outline=(80, 80, 80))
-    return img
+# --- Tray icons (colored circles with a gray outline, built from a NumPy mask; no ImageDraw) ---
+ICON_SIZE = 64
+_icon_dist = np.hypot(*(np.indices((ICON_SIZE, ICON_SIZE)) + 0.5 - ICON_SIZE / 2))
+_icon_radius = ICON_SIZE / 2 - 3.5  # 4 px margin
+ICON_FILL_MASK = _icon_dist <= _icon_radius - 1
+ICON_OUTLINE_MASK = (_icon_dist <= _icon_radius) & ~ICON_FILL_MASK
+
+
+def make_icon_image(color: tuple[int, int, int]) -> Image.Image:
+    arr = np.zeros((ICON_SIZE, ICON_SIZE, 4), dtype=np.uint8)
+    arr[ICON_FILL_MASK] = (*color, 255)
+    arr[ICON_OUTLINE_MASK] = (80, 80, 80, 255)
+    return Image.fromarray(arr, "RGBA")
 
 
 # Prebuild tray icons (PIL Image for pystray)
-ICON_SIZE = 64
 ICON_IDLE = make_icon_image((120, 120, 120))       # Gray
 ICON_RECORDING = make_icon_image((220, 50, 50))    # Red
 ICON_PROCESSING = make_icon_image((50, 180, 80))   # Green
@@ -150,7 +205,7 @@ def _overlay_thread(state_queue: Queue) -> None:
     if hwnd:
         ctypes.windll.user32.ShowWindow(hwnd, SW_SHOWNA)
     root.withdraw()  # start hidden; only show when Recording or Processing
-    root.after(200, lambda: _overlay_poll(root, label, state_queue))
+    threading.Thread(target=_overlay_worker, args=(root, label, state_queue), daemon=True).start()
 
     def on_closing():
         root.quit()
@@ -159,39 +214,49 @@ def _overlay_thread(state_queue: Queue) -> None:
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
 
-def _overlay_poll(root: tk.Tk, label: tk.Label, state_queue: Queue) -> None:
-    try:
-        while True:
-            state = state_queue.get_nowait()
-            if state is None:
-                root.after(0, lambda: (root.quit(), root.destroy()))
-                return
-            if state == State.RECORDING:
-                label.config(text="🔴 Speak now — then Ctrl+Shift+M to stop", fg="#ff6b6b")
-                root.deiconify()
-            elif state == State.PROCESSING:
-                label.config(text="🟢 Processing...", fg="#69db7c")
-                root.deiconify()
-            else:
-                root.withdraw()  # hide when Idle
-    except Empty:
-        pass
-    try:
-        root.after(200, lambda: _overlay_poll(root, label, state_queue))
-    except tk.TclError:
-        pass
+def _overlay_worker(root: tk.Tk, label: tk.Label, state_queue: Queue) -> None:
+    """Block on the state queue and hand each change to the Tk thread (no periodic wake-ups)."""
+    while True:
+        state = state_queue.get()
+        try:
+            root.after_idle(_apply_overlay_state, root, label, state)
+        except (tk.TclError, RuntimeError):
+            return  # window already gone
+        if state is None:
+            return
+
+def _apply_overlay_state(root: tk.Tk, label: tk.Label, state: State | None) -> None:
+    if state is None:
+        root.quit()
+        root.destroy()
+    elif state == State.RECORDING:
+        label.config(text="🔴 Speak now — then Ctrl+Shift+M to stop", fg="#ff6b6b")
+        root.deiconify()
+    elif state == State.PROCESSING:
+        label.config(text="🟢 Processing...", fg="#69db7c")
+        root.deiconify()
+    else:
+        root.withdraw()  # hide when Idle
 
 
 # --- Recording ---
 CHANNELS = 1
-DTYPE = np.int16
-
-
-def record_audio_until_stop(stop_event: threading.Event) -> tuple[np.ndarray | None, float, int]:
-    """Record from input until stop_event. Returns (samples_16k, duration_sec, record_sample_rate)."""
-    rec_cfg = CONFIG["recording"]
-    sample_rate = int(rec_cfg["sample_rate"])
-    device = rec_cfg.get("input_device")
+DTYPE = np.int16  # fallback when the device can't deliver float32
+MAX_RECORDING_SEC = 300  # audio past this is dropped (buffer is preallocated)
+
+
+def record_audio_until_stop(
+    stop_event: threading.Event, chunk_queue: Queue | None = None, chunk_sec: float = 0.0
+) -> tuple[np.ndarray | None, float, int]:
+    """Record from input until stop_event. Returns (samples, duration_sec, record_sample_rate).
+
+    samples are at record_sample_rate (resample with _resample_for_whisper if it isn't 16 kHz):
+    float32 in [-1, 1], or int16 if the device doesn't support float32.
+    If chunk_queue is given, raw blocks (device rate) of about chunk_sec are put on it while recording,
+    plus the remainder once stopped, so a StreamingTranscriber can work ahead.
+    """
+    sample_rate = RECORD_SAMPLE_RATE
+    device = CONFIG["recording"].get("input_device")
     if device is not None:
         try:
             sd.default.device = (int(device), sd.default.device[1] if isinstance(sd.default.device, tuple) else None)
@@ -205,28 +270,61 @@ def record_audio_until_stop(stop_event: threading.Event) -> tuple[np.ndarray | N
         except Exception:
             sd.default.device = None
 
-    chunks: list[np.ndarray] = []
+    # Prefer float32 straight from PortAudio: Whisper's input format, no int16 conversion later
+    try:
+        sd.check_input_settings(channels=CHANNELS, dtype="float32", samplerate=sample_rate)
+        dtype = np.float32
+    except (sd.PortAudioError, ValueError):
+        dtype = DTYPE
+
+    # Callback copies straight into one preallocated buffer: no per-block arrays, no final concatenate
+    buf = np.empty((sample_rate * MAX_RECORDING_SEC, CHANNELS), dtype=dtype)
+    off = 0
+    queued = 0  # audio up to here has been handed to chunk_queue
+    chunk_frames = max(1, int(chunk_sec * sample_rate))
+    capacity = len(buf)
+    truncated = False
+    stream_status = None  # last non-empty status; logged after stop, not on PortAudio's thread
+    callback_error: Exception | None = None
     start_time = time.perf_counter()
 
     def callback(indata: np.ndarray, frames: int, time_info, status):
-        if status:
-            log.warning("Sounddevice: %s", status)
-        chunks.append(indata.copy())
+        # Runs ~15x/s on PortAudio's thread: one slice copy into buf, no per-block allocations or logging
+        nonlocal off, queued, truncated, stream_status, callback_error
+        try:
+            if status:
+                stream_status = status
+            if off + frames <= capacity:
+                buf[off:off + frames] = indata
+                off += frames
+            else:
+                n = capacity - off
+                buf[off:capacity] = indata[:n]
+                off = capacity
+                truncated = True
+            if chunk_queue is not None and off - queued >= chunk_frames:
+                chunk_queue.put_nowait(buf[queued:off])  # view; that region is never written again
+                queued = off
+        except Exception as e:
+            callback_error = e
 
     try:
         stream = sd.InputStream(
             samplerate=sample_rate,
             channels=CHANNELS,
-            dtype=DTYPE,
+            dtype=dtype,
             blocksize=1024,
             callback=callback,
         )
         stream.start()
-        log.info("Recording started (rate=%d) — speak now (Ctrl+Shift+M to stop)", sample_rate)
-        while not stop_event.is_set():
-            stop_event.wait(0.1)
+        log.info(
+            "Recording started (rate=%d, %s) — speak now (Ctrl+Shift+M to stop)", sample_rate, np.dtype(dtype).name
+        )
+        stop_event.wait()  # audio arrives on PortAudio's thread; wake only when stopped
         stream.stop()
         stream.close()
+        if chunk_queue is not None and off > queued:
+            chunk_queue.put_nowait(buf[queued:off])
     except sd.PortAudioError as e:
         log.error("Microphone error: %s", e)
         return None, 0.0, sample_rate
@@ -235,62 +333,520 @@ def record_audio_until_stop(stop_event: threading.Event) -> tuple[np.ndarray | N
         return None, 0.0, sample_rate
 
     duration = time.perf_counter() - start_time
-    if not chunks:
+    if stream_status:
+        log.warning("Sounddevice: %s", stream_status)
+    if callback_error is not None:
+        log.error("Audio callback error: %s", callback_error)
+    if off == 0:
         log.warning("Recording stopped — no audio captured")
         return None, duration, sample_rate
-    samples = np.concatenate(chunks, axis=0)
+    if truncated:
+        log.warning("Recording exceeded %d s — audio after that was dropped", MAX_RECORDING_SEC)
+    samples = buf[:off]
     log.info("Recording stopped — duration %.1f s, %d samples @ %d Hz", duration, len(samples), sample_rate)
-
-    if sample_rate != WHISPER_TARGET_RATE:
-        num_out = int(round(len(samples) * WHISPER_TARGET_RATE / sample_rate))
-        samples = scipy_signal.resample(samples.astype(np.float64) / 32768.0, num_out)
-        samples = (samples * 32768.0).clip(-32768, 32767).astype(np.int16)
-        log.info("Resampled %d -> %d Hz for Whisper", sample_rate, WHISPER_TARGET_RATE)
     return samples, duration, sample_rate
 
 
+def _resample_for_whisper(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Polyphase FIR resample to 16 kHz float32 (O(N), no whole-recording FFT)."""
+    g = gcd(sample_rate, WHISPER_TARGET_RATE)
+    up, down = WHISPER_TARGET_RATE // g, sample_rate // g
+    return scipy_signal.resample_poly(_to_float32(samples), up, down).astype(np.float32, copy=False)
+
+
+class _BlockResampler:
+    """Resamples consecutive blocks to 16 kHz as if they were one signal.
+
+    Resampling each block on its own puts FIR edge transients at every block boundary. Instead,
+    the last CONTEXT input samples of the previous call are carried over as look-back, and output
+    is held back until CONTEXT samples of look-ahead exist; flush() emits the rest at the end.
+    """
+
+    CONTEXT = 256  # input samples; longer than resample_poly's default filter half-length
+
+    def __init__(self, sample_rate: int):
+        g = gcd(sample_rate, WHISPER_TARGET_RATE)
+        self._up, self._down = WHISPER_TARGET_RATE // g, sample_rate // g
+        # Multiple of `down` so every cut falls on an input sample that maps to a whole output sample
+        self._pad = -(-self.CONTEXT // self._down) * self._down
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._lead = 0  # samples at the start of _carry that were already emitted (look-back only)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        x = np.concatenate((self._carry, _to_float32(block)))
+        end = (len(x) - self._pad) // self._down * self._down
+        if end <= self._lead:
+            self._carry = x
+            return np.zeros(0, dtype=np.float32)
+        out = self._resample(x, end)
+        start = max(0, end - self._pad)
+        self._carry, self._lead = x[start:], end - start
+        return out
+
+    def flush(self) -> np.ndarray:
+        out = self._resample(self._carry, None)
+        self._carry, self._lead = np.zeros(0, dtype=np.float32), 0
+        return out
+
+    def _resample(self, x: np.ndarray, end: int | None) -> np.ndarray:
+        y = scipy_signal.resample_poly(x, self._up, self._down).astype(np.float32, copy=False)
+        first = self._lead * self._up // self._down
+        return y[first:] if end is None else y[first:end * self._up // self._down]
+
+
+def _i16_to_f32_numpy(x: np.ndarray) -> np.ndarray:
+    return x.astype(np.float32) * np.float32(1.0 / 32768.0)
+
+
+def _f32_to_i16_numpy(x: np.ndarray) -> np.ndarray:
+    return (x * 32768.0).clip(-32768, 32767).astype(np.int16)
+
+
+# Fused cast+scale(+clip) in one vectorized pass, no temporaries; compiled with Numba when available
+def _i16_to_f32_loop(x):
+    out = np.empty(x.shape[0], np.float32)
+    scale = np.float32(1.0 / 32768.0)
+    for i in range(x.shape[0]):
+        out[i] = x[i] * scale
+    return out
+
+
+def _f32_to_i16_loop(x):
+    out = np.empty(x.shape[0], np.int16)
+    for i in range(x.shape[0]):
+        v = x[i] * np.float32(32768.0)
+        if v > 32767.0:
+            v = np.float32(32767.0)
+        elif v < -32768.0:
+            v = np.float32(-32768.0)
+        out[i] = np.int16(v)
+    return out
+
+
+_conversion_kernels = None
+
+
+def _get_conversion_kernels():
+    """(int16->float32, float32->int16) converters.
+
+    Numba is imported on first use, not at startup: most devices deliver float32, so these only run
+    on the int16 capture fallback and when saving WAVs.
+    """
+    global _conversion_kernels
+    if _conversion_kernels is None:
+        try:
+            from numba import njit
+
+            jit = njit(fastmath=True, cache=True)
+            kernels = (jit(_i16_to_f32_loop), jit(_f32_to_i16_loop))
+            # Compile now so a JIT/cache failure (e.g. read-only install dir) lands here, not mid-dictation
+            kernels[0](np.zeros(1, dtype=np.int16))
+            kernels[1](np.zeros(1, dtype=np.float32))
+            _conversion_kernels = kernels
+        except Exception as e:
+            if not isinstance(e, ImportError):
+                log.warning("Numba kernels unavailable (%s); using NumPy conversion", e)
+            _conversion_kernels = (_i16_to_f32_numpy, _f32_to_i16_numpy)
+    return _conversion_kernels
+
+
+def _to_float32(samples: np.ndarray) -> np.ndarray:
+    """Mono float32 in [-1, 1] as Whisper expects."""
+    samples = samples.reshape(-1)
+    if samples.dtype == np.int16:
+        return _get_conversion_kernels()[0](np.ascontiguousarray(samples))
+    return samples.astype(np.float32, copy=False)
+
+
+def _to_int16(samples: np.ndarray) -> np.ndarray:
+    samples = samples.reshape(-1)
+    if samples.dtype == np.int16:
+        return samples
+    return _get_conversion_kernels()[1](np.ascontiguousarray(samples, dtype=np.float32))
+
+
+def trim_silence(
+    samples: np.ndarray,
+    sample_rate: int = WHISPER_TARGET_RATE,
+    thresh_db: float = -40.0,
+    frame_ms: int = 20,
+    pad_ms: int = 200,
+) -> np.ndarray:
+    """Cut leading/trailing frames whose RMS is below thresh_db (dBFS), keeping pad_ms around speech.
+
+    Returns the samples unchanged (flattened) if no frame is above the threshold; Whisper's VAD decides then.
+    """
+    x = samples.reshape(-1)
+    frame = max(1, sample_rate * frame_ms // 1000)
+    n_frames = len(x) // frame
+    if n_frames == 0:
+        return x
+    frames = x[: n_frames * frame].reshape(n_frames, frame).astype(np.float32, copy=False)
+    rms = np.sqrt((frames * frames).mean(axis=1))
+    full_scale = 32768.0 if x.dtype == np.int16 else 1.0
+    loud = np.flatnonzero(rms > full_scale * 10 ** (thresh_db / 20))
+    if loud.size == 0:
+        return x
+    pad = sample_rate * pad_ms // 1000
+    start = max(0, int(loud[0]) * frame - pad)
+    end = min(len(x), (int(loud[-1]) + 1) * frame + pad)
+    return x[start:end]
+
+
 def save_wav(samples: np.ndarray, path: str | Path, sample_rate: int = WHISPER_TARGET_RATE) -> None:
-    path = Path(path)
-    with wave.open(str(path), "wb") as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        wf.writeframes(samples.tobytes())
+    """Write 16-bit PCM WAV: a 44-byte RIFF header, then the samples in a single write."""
+    pcm = _to_int16(samples).astype("<i2", copy=False)
+    data_size = pcm.size * 2
+    block_align = CHANNELS * 2
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, CHANNELS, sample_rate, sample_rate * block_align, block_align, 16,
+        b"data", data_size,
+    )
+    with open(path, "wb") as f:
+        f.write(header)
+        pcm.tofile(f)
+
+
+# Disk writes run here so they never delay transcription
+_io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wav-writer")
+
+
+def _save_wav_in_background(samples: np.ndarray, path: Path, sample_rate: int = WHISPER_TARGET_RATE) -> None:
+    def job() -> None:
+        try:
+            save_wav(samples, path, sample_rate)
+            log.info("Saved recording to %s", path)
+        except Exception as e:
+            log.error("Could not save recording to %s: %s", path, e)
+
+    _io_pool.submit(job)
 
 
 # --- Transcription ---
+# Loaded once and kept resident for the process lifetime (loading takes seconds).
 _whisper_model_cache = None
+_whisper_lock = threading.Lock()  # warm-up and a hotkey press must not both construct the model
 
 def load_whisper_model():
-    global _whisper_model_cache
     if _whisper_model_cache is not None:
-        return _whisper_model_cache
-    w = CONFIG["whisper"]
-    _whisper_model_cache = WhisperModel(
-        w["model"],
-        device="cpu",
-        compute_type=w.get("compute_type") or "int8",
-    )
+        return _whisper_model_cache  # fast path, no lock once loaded
+    with _whisper_lock:
+        if _whisper_model_cache is None:
+            _load_whisper_model_locked()
     return _whisper_model_cache
 
 
-def transcribe_audio(wav_path: str | Path) -> str:
-    model = load_whisper_model()
+def _load_whisper_model_locked() -> None:
+    global _whisper_model_cache
     w = CONFIG["whisper"]
+    compute_type = w.get("compute_type") or "auto"
+    if compute_type == "auto":
+        compute_type = _pick_compute_type()
+    cpu_threads = CPU_THREADS
+    log.info("Loading Whisper model %r (compute_type=%s, cpu_threads=%d)...", w["model"], compute_type, cpu_threads)
+    try:
+        _whisper_model_cache = _create_whisper_model(w["model"], compute_type, cpu_threads)
+    except Exception as e:
+        if compute_type == "int8":
+            raise
+        log.warning("compute_type=%s failed (%s); falling back to int8", compute_type, e)
+        _whisper_model_cache = _create_whisper_model(w["model"], "int8", cpu_threads)
+
+
+def _create_whisper_model(model: str, compute_type: str, cpu_threads: int):
+    kwargs = dict(device="cpu", compute_type=compute_type, cpu_threads=cpu_threads, num_workers=1)
+    try:
+        # Skip the Hugging Face Hub round-trip when the model is already downloaded
+        return WhisperModel(model, local_files_only=True, **kwargs)
+    except LocalEntryNotFoundError:
+        log.info("Model %r not cached locally; downloading", model)
+        return WhisperModel(model, **kwargs)
+
+
+def _pick_compute_type() -> str:
+    """Widest int8 variant this CPU supports (bf16 activations need AVX512-BF16 / AMX)."""
+    try:
+        supported = ctranslate2.get_supported_compute_types("cpu")
+    except Exception:
+        return "int8"
+    for candidate in ("int8_bfloat16", "int8_float32"):
+        if candidate in supported:
+            return candidate
+    return "int8"
+
+
+def _warm_up_model() -> None:
+    """Load the model and run one dummy pass so the first hotkey press doesn't pay for it."""
+    try:
+        model = load_whisper_model()
+        segments, _ = model.transcribe(
+            np.zeros(WHISPER_TARGET_RATE, dtype=np.float32),
+            language=WHISPER_LANGUAGE or "en",
+            vad_filter=False,
+        )
+        list(segments)  # segments are lazy; consume to actually run the model
+        log.info("Whisper model ready")
+    except Exception as e:
+        log.warning("Model warm-up failed (will retry on first use): %s", e)
+
+
+def transcribe_audio(samples: np.ndarray) -> str:
+    """Transcribe 16 kHz mono samples (int16 or float32, passed in memory; no WAV/FFmpeg decode)."""
+    model = load_whisper_model()
+    audio = _to_float32(samples)
     segments, info = model.transcribe(
-        str(wav_path),
-        language=w.get("language"),
-        vad_filter=w.get("vad_filter", True),
+        audio,
+        language=WHISPER_LANGUAGE,
+        vad_filter=VAD_FILTER,
+        # Short dictation clips: greedy decoding, no cross-utterance context, no timestamps
+        beam_size=BEAM_SIZE,
+        best_of=1,
+        temperature=0.0,
+        condition_on_previous_text=False,
+        without_timestamps=True,
+        word_timestamps=False,
     )
     text = " ".join(s.text.strip() for s in segments if s.text and s.text.strip()).strip()
     return text or ""
 
 
+class StreamingTranscriber:
+    """Transcribes a recording chunk by chunk while it is still in progress.
+
+    Raw blocks from record_audio_until_stop() arrive on `queue`. Each time chunk_sec of audio has
+    accumulated, the worker cuts at the quietest 20 ms frame of the last second (so words aren't
+    split) and transcribes up to there. finish() then only has the tail left to transcribe.
+    Chunks never overlap, so their texts are simply joined.
+    """
+
+    SEARCH_SEC = 1.0
+    FRAME_MS = 20
+
+    def __init__(self, sample_rate: int, chunk_sec: float):
+        self.queue: Queue = Queue()
+        self._chunk_len = max(1, int(chunk_sec * WHISPER_TARGET_RATE))
+        self._resampler = _BlockResampler(sample_rate) if sample_rate != WHISPER_TARGET_RATE else None
+        self._pending = np.zeros(0, dtype=np.float32)  # 16 kHz audio not yet transcribed
+        self._texts: list[str] = []
+        self._failed = False
+        self._cancelled = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            block = self.queue.get()
+            if self._cancelled:
+                return
+            if self._failed:
+                if block is None:
+                    return
+                continue  # keep draining; finish() falls back to a full transcription
+            try:
+                if block is None:
+                    # End of recording: the resampler's held-back look-ahead becomes part of the tail
+                    if self._resampler is not None:
+                        self._pending = np.concatenate((self._pending, self._resampler.flush()))
+                    return
+                if self._resampler is None:
+                    audio = _to_float32(block)
+                else:
+                    audio = self._resampler.process(block)
+                self._pending = np.concatenate((self._pending, audio))
+                while len(self._pending) >= self._chunk_len and not self._cancelled:
+                    cut = self._quietest_cut()
+                    self._add_text(transcribe_audio(trim_silence(self._pending[:cut])))
+                    self._pending = self._pending[cut:]
+                    log.info("Transcribed %.1f s chunk while recording", cut / WHISPER_TARGET_RATE)
+            except Exception:
+                log.exception("Streaming transcription error; will transcribe the whole recording")
+                self._failed = True
+                if block is None:
+                    return  # nothing more will be queued; let finish() fall back
+
+    def _quietest_cut(self) -> int:
+        frame = WHISPER_TARGET_RATE * self.FRAME_MS // 1000
+        end = self._chunk_len
+        start = max(0, end - int(self.SEARCH_SEC * WHISPER_TARGET_RATE))
+        n_frames = (end - start) // frame
+        if n_frames == 0:
+            return end
+        frames = self._pending[start:start + n_frames * frame].reshape(n_frames, frame)
+        quietest = int(np.argmin((frames * frames).mean(axis=1)))
+        return start + quietest * frame + frame // 2
+
+    def _add_text(self, text: str) -> None:
+        if text:
+            self._texts.append(text)
+
+    def finish(self) -> str | None:
+        """Wait for queued chunks, transcribe the tail and return the full text (None if streaming failed)."""
+        self.queue.put(None)
+        self._thread.join()
+        if self._failed:
+            return None
+        if len(self._pending):
+            log.info("Transcribing remaining %.1f s...", len(self._pending) / WHISPER_TARGET_RATE)
+            self._add_text(transcribe_audio(trim_silence(self._pending)))
+        return " ".join(self._texts)  # chunks are disjoint: nothing to dedupe
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        self.queue.put(None)
+
+
 # --- Clipboard and paste ---
+# On Windows, talk to the clipboard and SendInput directly: no clip.exe subprocess, no pyautogui pauses.
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_V = 0x56
+HWND_MESSAGE = -3
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _HARDWAREINPUT(ctypes.Structure):
+        _fields_ = [("uMsg", wintypes.DWORD), ("wParamL", wintypes.WORD), ("wParamH", wintypes.WORD)]
+
+    class _INPUTUNION(ctypes.Union):
+        # All members present so sizeof(INPUT) matches what SendInput expects
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    _user32.OpenClipboard.argtypes = [wintypes.HWND]
+    _user32.OpenClipboard.restype = wintypes.BOOL
+    _user32.EmptyClipboard.restype = wintypes.BOOL
+    _user32.CloseClipboard.restype = wintypes.BOOL
+    _user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    _user32.SetClipboardData.restype = wintypes.HANDLE
+    _user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _user32.SendInput.restype = wintypes.UINT
+    _kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    _kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    _kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalLock.restype = wintypes.LPVOID
+    _kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalUnlock.restype = wintypes.BOOL
+    _kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalFree.restype = wintypes.HGLOBAL
+    _user32.CreateWindowExW.argtypes = [
+        wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+    ]
+    _user32.CreateWindowExW.restype = wintypes.HWND
+    _user32.DestroyWindow.argtypes = [wintypes.HWND]
+    _user32.DestroyWindow.restype = wintypes.BOOL
+
+
+def _win_set_clipboard(text: str) -> None:
+    data = text.encode("utf-16-le") + b"\x00\x00"
+    # SetClipboardData fails if the clipboard was opened without an owner window, so open it with a
+    # throwaway message-only window. It lives only for this call, on this thread, so the system never
+    # sends clipboard messages to a window whose thread isn't pumping them.
+    hwnd = _user32.CreateWindowExW(0, "STATIC", None, 0, 0, 0, 0, 0, HWND_MESSAGE, None, None, None)
+    if not hwnd:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        _win_set_clipboard_data(hwnd, data)
+    finally:
+        _user32.DestroyWindow(hwnd)
+
+
+def _win_set_clipboard_data(hwnd: int, data: bytes) -> None:
+    # Another app may briefly hold the clipboard; retry a few times
+    for _ in range(10):
+        if _user32.OpenClipboard(hwnd):
+            break
+        time.sleep(0.01)
+    else:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        _user32.EmptyClipboard()
+        handle = _kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not handle:
+            raise ctypes.WinError(ctypes.get_last_error())
+        ptr = _kernel32.GlobalLock(handle)
+        if not ptr:
+            _kernel32.GlobalFree(handle)
+            raise ctypes.WinError(ctypes.get_last_error())
+        ctypes.memmove(ptr, data, len(data))
+        _kernel32.GlobalUnlock(handle)
+        if not _user32.SetClipboardData(CF_UNICODETEXT, handle):
+            _kernel32.GlobalFree(handle)
+            raise ctypes.WinError(ctypes.get_last_error())
+        # On success the clipboard owns the memory; don't free it
+    finally:
+        _user32.CloseClipboard()
+
+
+def _win_send_ctrl_v() -> None:
+    def key(vk: int, flags: int = 0) -> _INPUT:
+        return _INPUT(type=INPUT_KEYBOARD, u=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+    inputs = (_INPUT * 4)(
+        key(VK_CONTROL),
+        key(VK_V),
+        key(VK_V, KEYEVENTF_KEYUP),
+        key(VK_CONTROL, KEYEVENTF_KEYUP),
+    )
+    if _user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT)) != len(inputs):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def _set_clipboard(text: str) -> None:
+    if sys.platform == "win32":
+        try:
+            _win_set_clipboard(text)
+            return
+        except Exception as e:
+            log.warning("Native clipboard failed (%s); falling back to pyperclip", e)
+    pyperclip.copy(text)
+
+
+def _send_paste() -> None:
+    if sys.platform == "win32":
+        try:
+            _win_send_ctrl_v()
+            return
+        except Exception as e:
+            log.warning("SendInput failed (%s); falling back to pyautogui", e)
+    pyautogui.hotkey("ctrl", "v")
+
+
 def copy_and_paste(text: str) -> None:
     """Always copy to clipboard; then try to paste with Ctrl+V."""
     try:
-        pyperclip.copy(text)
+        _set_clipboard(text)
         log.info("Copied to clipboard: %r", text[:80] + "..." if len(text) > 80 else text)
     except Exception as e:
         log.error("Clipboard copy error: %s", e)
@@ -298,7 +854,7 @@ def copy_and_paste(text: str) -> None:
     if not text:
         return
     try:
-        pyautogui.hotkey("ctrl", "v")
+        _send_paste()
         log.info("Paste (Ctrl+V) sent to focused window")
     except Exception as e:
         log.warning("Paste hotkey error (text is in clipboard): %s", e)
@@ -314,7 +870,6 @@ class DictationApp:
         self._recording_thread: threading.Thread | None = None
         self._icon: pystray.Icon | None = None
         self._last_hotkey_time = 0.0
-        self._hotkey_debounce_sec = float(CONFIG["ui"].get("hotkey_debounce_sec", 0.6))
 
     def set_state(self, new: State) -> None:
         with self._lock:
@@ -337,7 +892,7 @@ class DictationApp:
 
     def _on_hotkey(self) -> None:
         now = time.monotonic()
-        if now - self._last_hotkey_time < self._hotkey_debounce_sec:
+        if now - self._last_hotkey_time < HOTKEY_DEBOUNCE_SEC:
             return  # debounce: avoid double trigger when switching apps
         self._last_hotkey_time = now
         with self._lock:
@@ -357,23 +912,43 @@ class DictationApp:
         self._stop_recording.set()
 
     def _record_then_transcribe(self) -> None:
-        samples, duration, _ = record_audio_until_stop(self._stop_recording)
+        streamer = StreamingTranscriber(RECORD_SAMPLE_RATE, STREAM_CHUNK_SEC) if STREAM_CHUNK_SEC > 0 else None
+        samples, duration, sample_rate = record_audio_until_stop(
+            self._stop_recording,
+            streamer.queue if streamer is not None else None,
+            STREAM_CHUNK_SEC,
+        )
         if samples is None or len(samples) == 0:
+            if streamer is not None:
+                streamer.cancel()
             self.set_state(State.IDLE)
             return
-        min_dur = float(CONFIG["recording"].get("min_duration_sec", 1.2))
-        if duration < min_dur:
+        if duration < MIN_DURATION_SEC:
             log.warning("Recording too short (%.1fs) — speak while red, then press to stop", duration)
+            if streamer is not None:
+                streamer.cancel()
             self.set_state(State.IDLE)
             return
         self.set_state(State.PROCESSING)
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        saved_wav = RECORDINGS_DIR / f"recording_{timestamp}.wav"
         try:
-            save_wav(samples, saved_wav, WHISPER_TARGET_RATE)
-            log.info("Saved recording to %s", saved_wav)
-            log.info("Transcribing...")
-            text = transcribe_audio(saved_wav)
+            if SAVE_WAV:
+                timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+                saved_wav = RECORDINGS_DIR / f"recording_{timestamp}.wav"
+                _save_wav_in_background(samples, saved_wav, sample_rate)  # as recorded; no resample needed
+            text = streamer.finish() if streamer is not None else None
+            if text is None:
+                if sample_rate != WHISPER_TARGET_RATE:
+                    samples = _resample_for_whisper(samples, sample_rate)
+                    log.info("Resampled %d -> %d Hz for Whisper", sample_rate, WHISPER_TARGET_RATE)
+                trimmed = trim_silence(samples)
+                if len(trimmed) < len(samples):
+                    log.info(
+                        "Trimmed silence: %.1f s -> %.1f s",
+                        len(samples) / WHISPER_TARGET_RATE,
+                        len(trimmed) / WHISPER_TARGET_RATE,
+                    )
+                log.info("Transcribing...")
+                text = transcribe_audio(trimmed)
             log.info("Transcription result: %r", text if text else "(empty / no speech detected)")
             copy_and_paste(text)
         except Exception as e:
@@ -412,12 +987,13 @@ def main() -> None:
     _setup_logging()
     log.info("Voice dictation starting (Ctrl+Shift+M)")
     pyautogui.FAILSAFE = False
-    pyautogui.PAUSE = 0.05
+    pyautogui.PAUSE = 0  # fallback paste path only; no artificial delay between key events
 
     state_queue: Queue = Queue()
     overlay = threading.Thread(target=_overlay_thread, args=(state_queue,), daemon=True)
     overlay.start()
     time.sleep(0.3)  # let overlay create window
+    threading.Thread(target=_warm_up_model, daemon=True).start()
 
     app = DictationApp(state_queue)
     app.run_tray()